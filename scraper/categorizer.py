@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import Counter
+from functools import lru_cache
+
+import ahocorasick
 
 from .sources.base import Article
 from .config import CATEGORIES, DEFAULT_CATEGORY
@@ -11,50 +15,83 @@ from .config import CATEGORIES, DEFAULT_CATEGORY
 logger = logging.getLogger(__name__)
 
 
-def _build_text(article: Article) -> str:
-    """Combine article fields into a single lowercase searchable string."""
-    return " ".join(
-        [
-            article.title,
-            article.description,
-            " ".join(article.tags),
-        ]
-    ).lower()
+_Hits = tuple[tuple[int, int], ...]
 
+# Category keys in config order; scores are kept in a list indexed by position
+_CAT_KEYS = tuple(CATEGORIES)
 
-def categorize_article(article: Article) -> str:
-    """Return the best-matching category key for *article*."""
-    text = _build_text(article)
 
-    best_cat = DEFAULT_CATEGORY
-    best_score = 0
+def _build_index() -> tuple[dict[str, _Hits], ahocorasick.Automaton]:
+    """Index every keyword of every category for single-pass matching.
 
-    for cat, info in CATEGORIES.items():
-        score = 0
+    Short keywords (<= 3 chars) weigh 2 and must match a whole token, so they
+    go into a token → ``((category_idx, weight), ...)`` lookup table. Longer
+    ones weigh 1 and match as plain substrings through one Aho–Corasick
+    automaton whose values are ``(keyword, ((category_idx, weight), ...))``.
+    A keyword may belong to several categories.
+    """
+    hits: dict[str, list[tuple[int, int]]] = {}
+    for idx, info in enumerate(CATEGORIES.values()):
         for kw in info["keywords"]:
-            # Short keywords (<= 3 chars) need word-boundary matching
-            if len(kw) <= 3:
-                if re.search(rf"\b{re.escape(kw)}\b", text, re.IGNORECASE):
-                    score += 2
-            else:
-                if kw.lower() in text:
-                    score += 1
+            key = kw.casefold()
+            weight = 2 if len(kw) <= 3 else 1
+            if (idx, weight) not in hits.setdefault(key, []):
+                hits[key].append((idx, weight))
+
+    short: dict[str, _Hits] = {}
+    automaton = ahocorasick.Automaton()
+    for key, cats in hits.items():
+        if len(key) <= 3:
+            short[key] = tuple(cats)
+        else:
+            automaton.add_word(key, (key, tuple(cats)))
+    automaton.make_automaton()
+    return short, automaton
 
-        if score > best_score:
-            best_score = score
-            best_cat = cat
 
-    return best_cat
+_SHORT, _AC = _build_index()
+
+# Short keywords are looked up per token; "c#" / "f#" keep their symbols
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def _build_text(article: Article) -> str:
+    """Combine article fields into a single casefolded searchable string."""
+    return f"{article.title} {article.description} {' '.join(article.tags)}".casefold()
+
+
+@lru_cache(maxsize=4096)
+def _categorize_text(text: str) -> str:
+    """Return the best-matching category key for casefolded *text*.
+
+    Memoised: cross-posted articles (same title/description/tags from
+    several sources) are scored only once.
+    """
+    # Each distinct keyword scores once, however often it appears
+    hits = {tok: _SHORT[tok] for tok in _TOKEN_RE.findall(text) if tok in _SHORT}
+    hits.update(value for _end, value in _AC.iter(text))
+
+    scores = [0] * len(_CAT_KEYS)
+    for cats in hits.values():
+        for idx, weight in cats:
+            scores[idx] += weight
+
+    # max() keeps the first maximum, so ties go to the earlier category
+    best = max(range(len(scores)), key=scores.__getitem__)
+    return _CAT_KEYS[best] if scores[best] else DEFAULT_CATEGORY
+
+
+def categorize_article(article: Article) -> str:
+    """Return the best-matching category key for *article*."""
+    return _categorize_text(_build_text(article))
 
 
 def categorize_articles(articles: list[Article]) -> list[Article]:
     """Categorise every article in-place and return the list."""
     for a in articles:
-        a.category = categorize_article(a)
+        a.category = _categorize_text(_build_text(a))
 
-    dist: dict[str, int] = {}
-    for a in articles:
-        dist[a.category] = dist.get(a.category, 0) + 1
-    logger.info("Category distribution: %s", dist)
+    dist = Counter(a.category for a in articles)
+    logger.info("Category distribution: %s", dict(dist))
 
     return articles
@@ -10,13 +10,14 @@ Falls back to an expanded per-article digest when no AI token is available.
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import operator
 import os
 import re
 from collections import defaultdict
 
-import requests
+import orjson
 
 from .sources.base import Article
 from .config import AI_CONFIG, CATEGORIES
@@ -61,11 +62,39 @@ _SRC_SHORT = {
     "reddit": "rd", "lobsters": "lb", "hashnode": "hs",
 }
 
+# Fields read per article by _condense_articles, fetched in one C call
+_CONDENSE_FIELDS = operator.attrgetter(
+    "title", "source", "category", "score", "description", "tags"
+)
+
 # Token env var – ONLY GH_MODELS_TOKEN works with GitHub Models API.
 # The automatic GITHUB_TOKEN (${{ github.token }}) does NOT have access to
 # models.inference.ai.azure.com and would silently cause a 401 error.
 _TOKEN_VAR = "GH_MODELS_TOKEN"
 
+# Markdown code fences models sometimes wrap their JSON answer in
+_FENCE_OPEN = re.compile(r"^```(?:json)?\s*\n?")
+_FENCE_CLOSE = re.compile(r"\n?```\s*$")
+
+
+@functools.cache
+def _get_session():
+    """Return the shared Models API session, importing ``requests`` on first use.
+
+    One session lets retries and repeated digests reuse the TLS connection.
+    Retry's defaults never resend a POST after it reached the server, only
+    connection failures are retried.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.2))
+    )
+    return session
+
 
 def _get_token() -> str:
     """Return the GH_MODELS_TOKEN if set, otherwise empty string."""
@@ -166,19 +195,21 @@ def _condense_articles(articles: list[Article]) -> list[dict]:
     minimize input tokens while preserving all information the AI needs.
     """
     result: list[dict] = []
-    for idx, a in enumerate(articles):
+    for idx, (title, source, cat, score, desc, tags) in enumerate(
+        map(_CONDENSE_FIELDS, articles)
+    ):
         item: dict = {
             "id": idx,
-            "t": a.title,
-            "s": _SRC_SHORT.get(a.source, a.source),
-            "cat": a.category,
-            "sc": a.score,
+            "t": title,
+            "s": _SRC_SHORT.get(source, source),
+            "cat": cat,
+            "sc": score,
         }
-        desc = (a.description or "")[:_DESC_MAX_CHARS]
+        desc = (desc or "")[:_DESC_MAX_CHARS]
         if desc:
             item["d"] = desc
-        if a.tags:
-            item["tg"] = a.tags[:3]
+        if tags:
+            item["tg"] = tags[:3]
         result.append(item)
     return result
 
@@ -187,62 +218,60 @@ def _call_ai(
     condensed: list[dict], articles: list[Article], token: str
 ) -> list[dict]:
     """Send all articles to GitHub Models and get back digest entries."""
-    cat_counts: dict[str, int] = defaultdict(int)
+    # Categories are a fixed set: count into slots indexed by _CAT_ORDER
+    general = _CAT_RANK["general"]
+    counts = [0] * len(_CAT_ORDER)
     for a in articles:
-        cat_counts[a.category] += 1
-    cat_summary = ", ".join(f"{c}: {n}" for c, n in sorted(cat_counts.items()))
-
-    prompt = f"""You have {len(condensed)} articles to curate. Categories: {cat_summary}
-Keys: id=index, t=title, s=source(dt=devto,hn=hackernews,gh=github,rd=reddit,lb=lobsters,hs=hashnode), cat=category, d=desc, sc=score, tg=tags
-
-Write 13 to 15 digest entries. Each covers a distinct topic; merge related articles when relevant.
+        counts[_CAT_RANK.get(a.category, general)] += 1
+    cat_summary = ", ".join(
+        f"{c}: {n}" for c, n in zip(_CAT_ORDER, counts) if n
+    )
 
-Per entry: 80-110 words per language. Structure: hook → technical detail → takeaway.
-Formatting: **bold** key terms, `code` for names. Cover as many different categories as possible.
-Languages: English AND Brazilian Portuguese (natural tone, not literal translation).
+    # Only loaded once an AI call is actually made
+    import requests
 
-JSON format:
-[{{"title_en":"...","title_pt":"...","body_en":"80-110 words...","body_pt":"80-110 words...","category":"ai|web|devops|languages|frameworks|security|career|mobile|data|opensource|tools|general","source_ids":[0,3]}}]
+    from .prompts import DIGEST_PROMPT_BODY, SYSTEM_PROMPT
 
-Articles:
-{json.dumps(condensed, ensure_ascii=False)}"""
+    prompt = "".join(
+        (
+            f"You have {len(condensed)} articles to curate. "
+            f"Categories: {cat_summary}\n",
+            DIGEST_PROMPT_BODY,
+            orjson.dumps(condensed).decode(),
+        )
+    )
 
     prompt_chars = len(prompt)
     print(f"[AI] Sending {len(condensed)} articles to Models API (~{prompt_chars // 4} est. tokens)")
 
     try:
-        resp = requests.post(
+        payload = {
+            "model": MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": TEMPERATURE,
+            "max_tokens": _MAX_OUTPUT_TOKENS,
+        }
+        resp = _get_session().post(
             ENDPOINT,
             headers={
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             },
-            json={
-                "model": MODEL,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a tech newsletter writer. You produce "
-                            "13-15 digest entries in JSON format. Each entry "
-                            "has 80-110 words per language (English + Brazilian "
-                            "Portuguese). Respond with ONLY the JSON array."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                "temperature": TEMPERATURE,
-                "max_tokens": _MAX_OUTPUT_TOKENS,
-            },
+            data=orjson.dumps(payload),
             timeout=TIMEOUT,
         )
         resp.raise_for_status()
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         choice = data["choices"][0]
         raw = choice["message"]["content"]
         finish = choice.get("finish_reason", "unknown")
         usage = data.get("usage", {})
+        # Drop the outer response tree before parsing the embedded JSON
+        del data, choice
         logger.info(
             "AI response: %d chars, finish=%s, tokens=%s",
             len(raw), finish, usage,
@@ -263,7 +292,7 @@ Articles:
                 pass
         print(f"[AI] ✗ HTTP {code} from Models API — {body[:200]}")
         logger.error("AI HTTP %s: %s | body: %s", code, exc, body)
-    except json.JSONDecodeError as exc:
+    except orjson.JSONDecodeError as exc:
         print(f"[AI] ✗ AI returned invalid JSON: {exc}")
         logger.error("AI returned invalid JSON: %s", exc)
     except requests.exceptions.Timeout:
@@ -312,13 +341,13 @@ def _parse_json(text: str) -> list[dict]:
     text = text.strip()
     # Strip markdown code fences
     if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?\s*\n?", "", text)
-        text = re.sub(r"\n?```\s*$", "", text)
+        text = _FENCE_OPEN.sub("", text)
+        text = _FENCE_CLOSE.sub("", text)
     # Sometimes models add trailing text after the array
     bracket_end = text.rfind("]")
-    if bracket_end != -1:
+    if bracket_end != -1 and bracket_end != len(text) - 1:
         text = text[: bracket_end + 1]
-    return json.loads(text)
+    return orjson.loads(text)
 
 
 # ──────────────────────────────────────────────────
@@ -344,6 +373,7 @@ _CAT_ORDER = (
     "security", "career", "mobile", "data", "opensource",
     "tools", "general",
 )
+_CAT_RANK = {cat: i for i, cat in enumerate(_CAT_ORDER)}
 
 
 def _fallback_digest(articles: list[Article]) -> list[dict]:
@@ -353,19 +383,21 @@ def _fallback_digest(articles: list[Article]) -> list[dict]:
     producing a generous list so readers can browse and choose. Each entry
     includes all available metadata presented in a readable format.
     """
-    by_cat: dict[str, list[Article]] = defaultdict(list)
-    for a in articles:
-        by_cat[a.category].append(a)
-
-    # Sort each category by score descending
-    for cat in by_cat:
-        by_cat[cat].sort(key=lambda a: a.score, reverse=True)
-
-    # Pick top N per category for diversity (no global hard cap)
+    # One stable sort by (category order, score descending), then keep the
+    # first FALLBACK_PER_CAT of each category run for diversity (no global
+    # hard cap). Categories outside _CAT_ORDER are skipped.
+    ranked = sorted(
+        (a for a in articles if a.category in _CAT_RANK),
+        key=lambda a: (_CAT_RANK[a.category], -a.score),
+    )
     picks: list[Article] = []
-    for cat in _CAT_ORDER:
-        for a in by_cat.get(cat, [])[:FALLBACK_PER_CAT]:
+    current_cat, taken = "", 0
+    for a in ranked:
+        if a.category != current_cat:
+            current_cat, taken = a.category, 0
+        if taken < FALLBACK_PER_CAT:
             picks.append(a)
+            taken += 1
 
     digest: list[dict] = []
     for a in picks:
@@ -380,72 +412,58 @@ def _fallback_digest(articles: list[Article]) -> list[dict]:
         author_str = a.author or ""
         source_label = a.source.replace("_", " ").title()
 
-        # ── Build a rich English body ──
+        # ── Build rich English + Portuguese bodies in lock-step ──
         parts_en: list[str] = []
+        parts_pt: list[str] = []
 
         if desc:
             parts_en.append(desc)
+            parts_pt.append(desc)
         else:
             parts_en.append(
                 f"**{title}** caught attention in the {en_label.lower()} "
                 f"space today."
             )
-
-        # Technical context line
-        context_parts: list[str] = []
-        if tags_str:
-            context_parts.append(f"Tags: {tags_str}")
-        if author_str:
-            context_parts.append(f"Author: **{author_str}**")
-        if context_parts:
-            parts_en.append(" · ".join(context_parts))
-
-        # Community signals
-        signal_parts: list[str] = []
-        if score_str:
-            signal_parts.append(f"**{score_str}** points")
-        if a.comments_count:
-            signal_parts.append(f"**{a.comments_count}** comments")
-        signal_parts.append(f"via **{source_label}**")
-
-        parts_en.append(
-            "Community buzz: " + ", ".join(signal_parts) + ". "
-            "Check the original source below for the full story."
-        )
-
-        body_en = "\n\n".join(parts_en)
-
-        # ── Build a rich Portuguese body ──
-        parts_pt: list[str] = []
-
-        if desc:
-            parts_pt.append(desc)
-        else:
             parts_pt.append(
                 f"**{title}** chamou atenção no mundo de {pt_label.lower()} "
                 f"hoje."
             )
 
+        # Technical context line
+        ctx_en: list[str] = []
         ctx_pt: list[str] = []
         if tags_str:
+            ctx_en.append(f"Tags: {tags_str}")
             ctx_pt.append(f"Tags: {tags_str}")
         if author_str:
+            ctx_en.append(f"Author: **{author_str}**")
             ctx_pt.append(f"Autor: **{author_str}**")
-        if ctx_pt:
+        if ctx_en:
+            parts_en.append(" · ".join(ctx_en))
             parts_pt.append(" · ".join(ctx_pt))
 
+        # Community signals
+        signal_en: list[str] = []
         signal_pt: list[str] = []
         if score_str:
+            signal_en.append(f"**{score_str}** points")
             signal_pt.append(f"**{score_str}** pontos")
         if a.comments_count:
+            signal_en.append(f"**{a.comments_count}** comments")
             signal_pt.append(f"**{a.comments_count}** comentários")
+        signal_en.append(f"via **{source_label}**")
         signal_pt.append(f"via **{source_label}**")
 
+        parts_en.append(
+            "Community buzz: " + ", ".join(signal_en) + ". "
+            "Check the original source below for the full story."
+        )
         parts_pt.append(
             "Repercussão: " + ", ".join(signal_pt) + ". "
             "Confira a fonte original abaixo para a matéria completa."
         )
 
+        body_en = "\n\n".join(parts_en)
         body_pt = "\n\n".join(parts_pt)
 
         sources = [{"title": a.title, "url": a.url, "source": a.source}]
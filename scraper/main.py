@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
+
+import requests
 
 from .sources import ALL_SCRAPERS
-from .sources.base import Article
+from .sources.base import Article, make_session
 from .categorizer import categorize_articles
 from .curator import create_digest
-from .output import save_daily_data, update_index, cleanup_old_data
+from .output import (
+    cleanup_old_data,
+    save_daily_data,
+    scan_data_dates,
+    update_index,
+)
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -27,14 +36,27 @@ logger = logging.getLogger(__name__)
 # Helpers
 # ---------------------------------------------------------------------------
 def _deduplicate(articles: list[Article]) -> list[Article]:
-    seen: set[str] = set()
-    unique: list[Article] = []
+    # First article per normalised URL wins; dicts keep insertion order, so
+    # one setdefault per article replaces the membership test + add.
+    unique: dict[str, Article] = {}
     for a in articles:
-        key = a.url.rstrip("/").lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(a)
-    return unique
+        unique.setdefault(a.url.rstrip("/").lower(), a)
+    return list(unique.values())
+
+
+def _run_scraper(
+    scraper_cls: type, fetched_at: str, session: requests.Session
+) -> tuple[str, list[Article]]:
+    """Run one scraper with error isolation; returns ``(name, articles)``."""
+    scraper = scraper_cls(fetched_at=fetched_at, session=session)
+    logger.info("Running %s …", scraper.name)
+    try:
+        arts = scraper.fetch()
+        logger.info("  → %s: %d items", scraper.name, len(arts))
+    except Exception as exc:
+        logger.error("  ✗ %s failed: %s", scraper.name, exc)
+        arts = []
+    return scraper.name, arts
 
 
 # ---------------------------------------------------------------------------
@@ -45,38 +67,46 @@ def run() -> None:
     logger.info("Keep Up Daily — starting scraper run")
     logger.info("=" * 60)
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    now = datetime.now(timezone.utc)
+    today = now.strftime("%Y-%m-%d")
+    fetched_at = now.isoformat()
     all_articles: list[Article] = []
     stats: dict[str, int] = {}
 
-    for scraper_cls in ALL_SCRAPERS:
-        scraper = scraper_cls()
-        logger.info("Running %s …", scraper.name)
-        try:
-            arts = scraper.fetch()
-            stats[scraper.name] = len(arts)
-            all_articles.extend(arts)
-            logger.info("  → %d items", len(arts))
-        except Exception as exc:
-            logger.error("  ✗ %s failed: %s", scraper.name, exc)
-            stats[scraper.name] = 0
+    # Sources are independent and I/O-bound, so fetch them concurrently
+    # through one shared connection pool. Results are merged in ALL_SCRAPERS
+    # order to keep dedup deterministic.
+    with make_session() as session, ThreadPoolExecutor(
+        max_workers=max(1, len(ALL_SCRAPERS))
+    ) as pool:
+        results = list(
+            pool.map(
+                lambda cls: _run_scraper(cls, fetched_at, session), ALL_SCRAPERS
+            )
+        )
+    for name, arts in results:
+        stats[name] = len(arts)
+        all_articles.extend(arts)
 
     before = len(all_articles)
     all_articles = _deduplicate(all_articles)
     logger.info("Dedup: %d → %d articles", before, len(all_articles))
 
     all_articles = categorize_articles(all_articles)
-    all_articles.sort(key=lambda a: a.score, reverse=True)
+    all_articles.sort(key=attrgetter("score"), reverse=True)
 
     # ── AI digest: distil all articles into ~12 readable entries ──
     digest = create_digest(all_articles)
 
     save_daily_data(all_articles, digest=digest, date=today)
-    update_index()
 
-    removed = cleanup_old_data()
+    # One directory scan feeds both retention cleanup and the index, and
+    # cleaning up first keeps just-deleted dates out of index.json
+    kept, expired = scan_data_dates()
+    removed = cleanup_old_data(expired)
     if removed:
         logger.info("Cleaned up %d old data file(s)", removed)
+    update_index(kept)
 
     logger.info("=" * 60)
     logger.info(
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import orjson
+
 from .sources.base import Article
 from .config import DATA_DIR, RETENTION_DAYS
 
@@ -31,11 +33,12 @@ def save_daily_data(
         "digest": digest or [],
         "digest_count": len(digest or []),
         "raw_article_count": len(articles),
-        "sources": sorted(set(a.source for a in articles)),
-        "articles": [a.to_dict() for a in articles],
+        "sources": sorted({a.source for a in articles}),
+        # orjson serialises (slotted) dataclasses natively, in field order
+        "articles": articles,
     }
 
-    filepath.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    filepath.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     logger.info(
         "Saved %d digest entries + %d raw articles → %s",
         len(digest or []),
@@ -45,14 +48,42 @@ def save_daily_data(
     return filepath
 
 
-def update_index() -> Path:
-    """Regenerate ``data/index.json`` with the list of available dates."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+def scan_data_dates() -> tuple[list[str], list[str]]:
+    """List data-file dates in one directory pass, split by retention.
 
-    dates = sorted(
-        [f.stem for f in DATA_DIR.glob("*.json") if f.stem != "index"],
-        reverse=True,
+    Returns ``(kept, expired)``, both newest first; *expired* holds dates
+    older than *RETENTION_DAYS*.
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)).strftime(
+        "%Y-%m-%d"
     )
+    kept: list[str] = []
+    expired: list[str] = []
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or entry.name == "index.json":
+                continue
+            date = entry.name[: -len(".json")]
+            (expired if date < cutoff else kept).append(date)
+    kept.sort(reverse=True)
+    expired.sort(reverse=True)
+    return kept, expired
+
+
+def update_index(dates: list[str] | None = None) -> Path:
+    """Regenerate ``data/index.json`` with the list of available dates.
+
+    *dates* (newest first) can be passed in from :func:`scan_data_dates` to
+    skip rescanning the directory.
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    if dates is None:
+        dates = sorted(
+            [f.stem for f in DATA_DIR.glob("*.json") if f.stem != "index"],
+            reverse=True,
+        )
 
     index = {
         "updated_at": datetime.now(timezone.utc).isoformat(),
@@ -61,20 +92,23 @@ def update_index() -> Path:
     }
 
     index_path = DATA_DIR / "index.json"
-    index_path.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+    index_path.write_bytes(orjson.dumps(index, option=orjson.OPT_INDENT_2))
     logger.info("Index updated: %d dates available", len(dates))
     return index_path
 
 
-def cleanup_old_data() -> int:
-    """Delete data files older than *RETENTION_DAYS*. Returns count removed."""
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)).strftime(
-        "%Y-%m-%d"
-    )
+def cleanup_old_data(expired: list[str] | None = None) -> int:
+    """Delete data files older than *RETENTION_DAYS*. Returns count removed.
+
+    *expired* can be passed in from :func:`scan_data_dates` to skip
+    rescanning the directory.
+    """
+    if expired is None:
+        _, expired = scan_data_dates()
     removed = 0
-    for f in DATA_DIR.glob("*.json"):
-        if f.stem != "index" and f.stem < cutoff:
-            f.unlink()
-            removed += 1
-            logger.info("Removed old data: %s", f.name)
+    for date in expired:
+        f = DATA_DIR / f"{date}.json"
+        f.unlink()
+        removed += 1
+        logger.info("Removed old data: %s", f.name)
     return removed
@@ -0,0 +1,27 @@
+"""Prompt templates for the AI digest (GitHub Models API).
+
+Kept apart from ``curator`` so the fallback path never has to load them.
+"""
+
+SYSTEM_PROMPT = (
+    "You are a tech newsletter writer. You produce "
+    "13-15 digest entries in JSON format. Each entry "
+    "has 80-110 words per language (English + Brazilian "
+    "Portuguese). Respond with ONLY the JSON array."
+)
+
+# Fixed part of the user prompt: sits between the per-run header line
+# ("You have N articles to curate. Categories: ...") and the articles JSON.
+DIGEST_PROMPT_BODY = """Keys: id=index, t=title, s=source(dt=devto,hn=hackernews,gh=github,rd=reddit,lb=lobsters,hs=hashnode), cat=category, d=desc, sc=score, tg=tags
+
+Write 13 to 15 digest entries. Each covers a distinct topic; merge related articles when relevant.
+
+Per entry: 80-110 words per language. Structure: hook → technical detail → takeaway.
+Formatting: **bold** key terms, `code` for names. Cover as many different categories as possible.
+Languages: English AND Brazilian Portuguese (natural tone, not literal translation).
+
+JSON format:
+[{"title_en":"...","title_pt":"...","body_en":"80-110 words...","body_pt":"80-110 words...","category":"ai|web|devops|languages|frameworks|security|career|mobile|data|opensource|tools|general","source_ids":[0,3]}]
+
+Articles:
+"""
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-@dataclass
+from ..config import USER_AGENT
+
+
+@dataclass(slots=True)
 class Article:
     """Normalised representation of a single piece of content."""
 
@@ -30,7 +36,23 @@ class Article:
     # Serialisation helpers
     # ------------------------------------------------------------------
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Spelled out rather than dataclasses.asdict(), which reflects over
+        # the fields and deep-copies every value on each call
+        return {
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "description": self.description,
+            "author": self.author,
+            "tags": list(self.tags),
+            "category": self.category,
+            "score": self.score,
+            "comments_count": self.comments_count,
+            "reading_time_min": self.reading_time_min,
+            "published_at": self.published_at,
+            "fetched_at": self.fetched_at,
+            "language": self.language,
+        }
 
     @staticmethod
     def from_dict(data: dict) -> "Article":
@@ -38,12 +60,41 @@ class Article:
         return Article(**{k: v for k, v in data.items() if k in known})
 
 
+def make_session() -> requests.Session:
+    """Return a pooled, retrying HTTP session carrying our User-Agent.
+
+    Keep-alive lets repeated calls to one host (e.g. the HackerNews item
+    endpoint) skip the TCP + TLS handshake. Idempotent requests are retried
+    on connection errors and 5xx responses.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    retry = Retry(
+        total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry),
+    )
+    return session
+
+
 class BaseScraper:
     """Abstract base class every source scraper must extend."""
 
     name: str = "base"
     base_url: str = ""
 
+    def __init__(
+        self,
+        fetched_at: str | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
+        # A session shared by all scrapers pools connections across sources
+        self.session = session or make_session()
+        # One timestamp per run, stamped on every Article this scraper builds
+        self.fetched_at = fetched_at or datetime.now(timezone.utc).isoformat()
+
     def fetch(self) -> list[Article]:
         """Return a list of Articles from the source.
 
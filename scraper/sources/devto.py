@@ -2,13 +2,15 @@
 
 import logging
 
-import requests
+import orjson
 
 from .base import Article, BaseScraper
-from ..config import SOURCES, REQUEST_TIMEOUT, USER_AGENT
+from ..config import SOURCES, REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+_HEADERS = {"Accept": "application/json"}
+
 
 class DevtoScraper(BaseScraper):
     name = "devto"
@@ -23,16 +25,15 @@ class DevtoScraper(BaseScraper):
         articles: list[Article] = []
 
         try:
-            headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
-            resp = requests.get(
+            resp = self.session.get(
                 f"{self.base_url}/articles",
                 params={"top": 1, "per_page": limit},
-                headers=headers,
+                headers=_HEADERS,
                 timeout=REQUEST_TIMEOUT,
             )
             resp.raise_for_status()
 
-            for item in resp.json()[:limit]:
+            for item in orjson.loads(resp.content)[:limit]:
                 a = Article(
                     title=item.get("title", ""),
                     url=item.get("url", ""),
@@ -44,6 +45,7 @@ class DevtoScraper(BaseScraper):
                     comments_count=item.get("comments_count", 0),
                     reading_time_min=item.get("reading_time_minutes", 0),
                     published_at=item.get("published_at", ""),
+                    fetched_at=self.fetched_at,
                 )
                 if a.title and a.url:
                     articles.append(a)
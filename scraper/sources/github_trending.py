@@ -1,15 +1,35 @@
 """GitHub Trending scraper — scrapes the trending page."""
 
+from __future__ import annotations
+
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
 
 from .base import Article, BaseScraper
-from ..config import SOURCES, REQUEST_TIMEOUT, USER_AGENT
+from ..config import SOURCES, REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; each trending page has ~25 repo rows to query.
+# smart_strings=False returns plain str that don't keep the tree alive.
+_ROWS = XPath(
+    "//article[contains(concat(' ', normalize-space(@class), ' '), ' Box-row ')]"
+)
+_HREF = XPath("(.//h2//a)[1]/@href", smart_strings=False)
+_DESC = XPath("normalize-space((.//p)[1])", smart_strings=False)
+_LANG = XPath(
+    "normalize-space((.//*[@itemprop='programmingLanguage'])[1])",
+    smart_strings=False,
+)
+_STARS = XPath(
+    "normalize-space((.//span[contains(@class, 'd-inline-block')"
+    " and contains(@class, 'float-sm-right')])[1])",
+    smart_strings=False,
+)
+
 
 class GitHubTrendingScraper(BaseScraper):
     name = "github_trending"
@@ -23,69 +43,65 @@ class GitHubTrendingScraper(BaseScraper):
         languages: list[str] = cfg.get("languages", [""])
         articles: list[Article] = []
         seen: set[str] = set()
-        headers = {"User-Agent": USER_AGENT}
-
-        for lang in languages:
-            try:
-                url = f"{self.base_url}/{lang}" if lang else self.base_url
-                resp = requests.get(
-                    url,
-                    params={"since": "daily"},
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                )
-                resp.raise_for_status()
-
-                soup = BeautifulSoup(resp.text, "lxml")
-                for repo in soup.select("article.Box-row"):
-                    try:
-                        h2 = repo.select_one("h2 a")
-                        if not h2:
-                            continue
-                        path = h2.get("href", "").strip()
-                        repo_url = f"https://github.com{path}"
-                        if repo_url in seen:
-                            continue
-                        seen.add(repo_url)
-
-                        repo_name = path.strip("/")
-
-                        desc_el = repo.select_one("p")
-                        description = desc_el.get_text(strip=True) if desc_el else ""
-
-                        lang_el = repo.select_one(
-                            "[itemprop='programmingLanguage']"
-                        )
-                        prog_lang = lang_el.get_text(strip=True) if lang_el else ""
-
-                        stars_today = 0
-                        stars_el = repo.select_one(
-                            "span.d-inline-block.float-sm-right"
-                        )
-                        if stars_el:
-                            digits = "".join(
-                                filter(str.isdigit, stars_el.get_text(strip=True))
-                            )
-                            stars_today = int(digits) if digits else 0
-
-                        tags = [prog_lang.lower()] if prog_lang else []
-                        articles.append(
-                            Article(
-                                title=repo_name,
-                                url=repo_url,
-                                source="github_trending",
-                                description=description,
-                                tags=tags,
-                                score=stars_today,
-                            )
-                        )
-                    except Exception as exc:
-                        logger.warning("GitHub Trending: parse error: %s", exc)
 
-            except Exception as exc:
-                logger.error(
-                    "GitHub Trending: failed for '%s': %s", lang or "all", exc
-                )
+        # One page per language, fetched and parsed in parallel
+        with ThreadPoolExecutor(max_workers=max(1, len(languages))) as pool:
+            results = pool.map(self._fetch_language, languages)
+            # Merge in config order; a repo trending in several languages
+            # keeps its first occurrence
+            for repos in results:
+                for a in repos:
+                    if a.url not in seen:
+                        seen.add(a.url)
+                        articles.append(a)
 
         logger.info("GitHub Trending: fetched %d repos", len(articles))
         return articles
+
+    def _fetch_language(self, lang: str) -> list[Article]:
+        """Scrape one trending page; returns ``[]`` on failure."""
+        repos: list[Article] = []
+        try:
+            url = f"{self.base_url}/{lang}" if lang else self.base_url
+            resp = self.session.get(
+                url,
+                params={"since": "daily"},
+                timeout=REQUEST_TIMEOUT,
+            )
+            resp.raise_for_status()
+
+            tree = lxml_html.fromstring(resp.content)
+            for repo in _ROWS(tree):
+                try:
+                    hrefs = _HREF(repo)
+                    if not hrefs:
+                        continue
+                    path = hrefs[0].strip()
+                    repo_url = f"https://github.com{path}"
+
+                    repo_name = path.strip("/")
+                    description = _DESC(repo)
+                    prog_lang = _LANG(repo)
+
+                    digits = "".join(filter(str.isdigit, _STARS(repo)))
+                    stars_today = int(digits) if digits else 0
+
+                    tags = [prog_lang.lower()] if prog_lang else []
+                    repos.append(
+                        Article(
+                            title=repo_name,
+                            url=repo_url,
+                            source="github_trending",
+                            description=description,
+                            tags=tags,
+                            score=stars_today,
+                            fetched_at=self.fetched_at,
+                        )
+                    )
+                except Exception as exc:
+                    logger.warning("GitHub Trending: parse error: %s", exc)
+
+        except Exception as exc:
+            logger.error("GitHub Trending: failed for '%s': %s", lang or "all", exc)
+
+        return repos
@@ -1,16 +1,26 @@
-"""HackerNews scraper — uses the official Firebase API."""
+"""HackerNews scraper — uses the Algolia HN Search API.
+
+The whole front page comes back in one request. If Algolia is unavailable
+the scraper falls back to the official Firebase API (one request per story).
+"""
+
+from __future__ import annotations
 
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
+import orjson
 
 from .base import Article, BaseScraper
-from ..config import SOURCES, REQUEST_TIMEOUT, USER_AGENT
+from ..config import SOURCES, REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
 HN_API = "https://hacker-news.firebaseio.com/v0"
+HN_ALGOLIA = "https://hn.algolia.com/api/v1/search"
+
+# Concurrent item requests — the bounded pool keeps us polite to the API
+_MAX_WORKERS = 10
 
 
 class HackerNewsScraper(BaseScraper):
@@ -24,52 +34,91 @@ class HackerNewsScraper(BaseScraper):
 
         limit = cfg.get("max_articles", 30)
         articles: list[Article] = []
-        headers = {"User-Agent": USER_AGENT}
 
         try:
-            resp = requests.get(
-                f"{HN_API}/topstories.json",
-                headers=headers,
-                timeout=REQUEST_TIMEOUT,
-            )
-            resp.raise_for_status()
-            story_ids = resp.json()[:limit]
-
-            for sid in story_ids:
-                try:
-                    r = requests.get(
-                        f"{HN_API}/item/{sid}.json",
-                        headers=headers,
-                        timeout=REQUEST_TIMEOUT,
-                    )
-                    r.raise_for_status()
-                    item = r.json()
-                    if not item or item.get("type") != "story":
-                        continue
-
-                    url = item.get(
-                        "url",
-                        f"https://news.ycombinator.com/item?id={sid}",
-                    )
-
-                    a = Article(
-                        title=item.get("title", ""),
-                        url=url,
-                        source="hackernews",
-                        description="",
-                        author=item.get("by", ""),
-                        score=item.get("score", 0),
-                        comments_count=item.get("descendants", 0),
-                    )
-                    if a.title:
-                        articles.append(a)
-
-                    time.sleep(0.05)  # be respectful
-                except Exception as exc:
-                    logger.warning("HN: story %s failed: %s", sid, exc)
-
-            logger.info("HackerNews: fetched %d articles", len(articles))
+            articles = self._fetch_algolia(limit)
         except Exception as exc:
-            logger.error("HackerNews scraper error: %s", exc)
+            logger.warning("HN: Algolia search failed, using Firebase: %s", exc)
 
+        if not articles:
+            try:
+                articles = self._fetch_firebase(limit)
+            except Exception as exc:
+                logger.error("HackerNews scraper error: %s", exc)
+
+        logger.info("HackerNews: fetched %d articles", len(articles))
         return articles
+
+    def _fetch_algolia(self, limit: int) -> list[Article]:
+        """Fetch the front page in a single Algolia search request."""
+        resp = self.session.get(
+            HN_ALGOLIA,
+            params={"tags": "front_page", "hitsPerPage": limit},
+            timeout=REQUEST_TIMEOUT,
+        )
+        resp.raise_for_status()
+
+        articles: list[Article] = []
+        for hit in orjson.loads(resp.content).get("hits", []):
+            sid = hit.get("objectID", "")
+            a = Article(
+                title=hit.get("title") or "",
+                url=hit.get("url")
+                or f"https://news.ycombinator.com/item?id={sid}",
+                source="hackernews",
+                description="",
+                author=hit.get("author") or "",
+                score=hit.get("points") or 0,
+                comments_count=hit.get("num_comments") or 0,
+                published_at=hit.get("created_at") or "",
+                fetched_at=self.fetched_at,
+            )
+            if a.title:
+                articles.append(a)
+        return articles
+
+    def _fetch_firebase(self, limit: int) -> list[Article]:
+        """Fetch top stories from the Firebase API, one request per item."""
+        resp = self.session.get(
+            f"{HN_API}/topstories.json",
+            timeout=REQUEST_TIMEOUT,
+        )
+        resp.raise_for_status()
+        story_ids = orjson.loads(resp.content)[:limit]
+
+        # Items are independent: fetch them in parallel, keep rank order
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            results = pool.map(self._fetch_item, story_ids)
+            return [a for a in results if a is not None]
+
+    def _fetch_item(self, sid: int) -> Article | None:
+        """Fetch a single story; returns ``None`` if skipped or failed."""
+        try:
+            r = self.session.get(
+                f"{HN_API}/item/{sid}.json",
+                timeout=REQUEST_TIMEOUT,
+            )
+            r.raise_for_status()
+            item = orjson.loads(r.content)
+            if not item or item.get("type") != "story":
+                return None
+
+            url = item.get(
+                "url",
+                f"https://news.ycombinator.com/item?id={sid}",
+            )
+
+            a = Article(
+                title=item.get("title", ""),
+                url=url,
+                source="hackernews",
+                description="",
+                author=item.get("by", ""),
+                score=item.get("score", 0),
+                comments_count=item.get("descendants", 0),
+                fetched_at=self.fetched_at,
+            )
+            return a if a.title else None
+        except Exception as exc:
+            logger.warning("HN: story %s failed: %s", sid, exc)
+            return None
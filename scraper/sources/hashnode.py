@@ -2,14 +2,15 @@
 
 import logging
 
-import requests
+import orjson
 
 from .base import Article, BaseScraper
-from ..config import SOURCES, REQUEST_TIMEOUT, USER_AGENT
+from ..config import SOURCES, REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
 HASHNODE_GQL = "https://gql.hashnode.com"
+_HEADERS = {"Content-Type": "application/json"}
 
 # -----------------------------------------------------------------------
 # GraphQL query – fetches the public best / trending feed.
@@ -50,18 +51,14 @@ class HashnodeScraper(BaseScraper):
         articles: list[Article] = []
 
         try:
-            headers = {
-                "User-Agent": USER_AGENT,
-                "Content-Type": "application/json",
-            }
-            resp = requests.post(
+            resp = self.session.post(
                 HASHNODE_GQL,
                 json={"query": FEED_QUERY, "variables": {"first": limit}},
-                headers=headers,
+                headers=_HEADERS,
                 timeout=REQUEST_TIMEOUT,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             edges = (
                 data.get("data", {}).get("feed", {}).get("edges", [])
@@ -87,6 +84,7 @@ class HashnodeScraper(BaseScraper):
                     comments_count=node.get("responseCount", 0),
                     reading_time_min=node.get("readTimeInMinutes", 0),
                     published_at=node.get("publishedAt", ""),
+                    fetched_at=self.fetched_at,
                 )
                 if a.title and a.url:
                     articles.append(a)
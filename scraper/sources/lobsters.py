@@ -2,10 +2,10 @@
 
 import logging
 
-import requests
+import orjson
 
 from .base import Article, BaseScraper
-from ..config import SOURCES, REQUEST_TIMEOUT, USER_AGENT
+from ..config import SOURCES, REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +21,15 @@ class LobstersScraper(BaseScraper):
 
         limit = cfg.get("max_articles", 25)
         articles: list[Article] = []
-        headers = {"User-Agent": USER_AGENT}
 
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 f"{self.base_url}/hottest.json",
-                headers=headers,
                 timeout=REQUEST_TIMEOUT,
             )
             resp.raise_for_status()
 
-            for item in resp.json()[:limit]:
+            for item in orjson.loads(resp.content)[:limit]:
                 url = item.get("url") or item.get("comments_url", "")
 
                 submitter = item.get("submitter_user")
@@ -50,6 +48,7 @@ class LobstersScraper(BaseScraper):
                     tags=item.get("tags", []),
                     score=item.get("score", 0),
                     comments_count=item.get("comment_count", 0),
+                    fetched_at=self.fetched_at,
                 )
                 if a.title and a.url:
                     articles.append(a)
@@ -1,15 +1,24 @@
 """Reddit scraper — uses the public JSON endpoints."""
 
+from __future__ import annotations
+
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
+import orjson
 
 from .base import Article, BaseScraper
-from ..config import SOURCES, REQUEST_TIMEOUT, USER_AGENT, REQUEST_DELAY
+from ..config import SOURCES, REQUEST_TIMEOUT, REQUEST_DELAY
 
 logger = logging.getLogger(__name__)
 
+# Subreddits fetched at once; each worker still waits REQUEST_DELAY between
+# its own requests, so reddit.com never sees more than this many in flight.
+_MAX_WORKERS = 4
+
+_HEADERS = {"Accept": "application/json"}
+
 
 class RedditScraper(BaseScraper):
     name = "reddit"
@@ -24,51 +33,63 @@ class RedditScraper(BaseScraper):
         max_per = cfg.get("max_per_subreddit", 10)
         articles: list[Article] = []
         seen: set[str] = set()
-        headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
-
-        for sub in subreddits:
-            try:
-                resp = requests.get(
-                    f"{self.base_url}/r/{sub}/hot.json",
-                    params={"limit": max_per, "t": "day"},
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                )
-                resp.raise_for_status()
-
-                children = resp.json().get("data", {}).get("children", [])
-                for post in children:
-                    d = post.get("data", {})
-                    if d.get("stickied"):
-                        continue
-
-                    url = d.get("url", "")
-                    permalink = f"https://www.reddit.com{d.get('permalink', '')}"
-                    target = url if url and not url.startswith("/r/") else permalink
-
-                    if target in seen:
-                        continue
-                    seen.add(target)
-
-                    selftext = d.get("selftext", "")
-                    desc = (selftext[:300] + "...") if len(selftext) > 300 else selftext
-
-                    a = Article(
-                        title=d.get("title", ""),
-                        url=target,
-                        source="reddit",
-                        description=desc,
-                        author=d.get("author", ""),
-                        tags=[f"r/{sub}"],
-                        score=d.get("score", 0),
-                        comments_count=d.get("num_comments", 0),
-                    )
-                    if a.title and a.url:
-                        articles.append(a)
 
-                time.sleep(REQUEST_DELAY)
-            except Exception as exc:
-                logger.error("Reddit r/%s error: %s", sub, exc)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            results = pool.map(
+                lambda sub: self._fetch_subreddit(sub, max_per),
+                subreddits,
+            )
+            # Merge in config order so cross-posts keep their first subreddit
+            for posts in results:
+                for a in posts:
+                    if a.url not in seen:
+                        seen.add(a.url)
+                        articles.append(a)
 
         logger.info("Reddit: fetched %d posts", len(articles))
         return articles
+
+    def _fetch_subreddit(self, sub: str, max_per: int) -> list[Article]:
+        """Fetch hot posts of one subreddit; returns ``[]`` on failure."""
+        posts: list[Article] = []
+        try:
+            resp = self.session.get(
+                f"{self.base_url}/r/{sub}/hot.json",
+                params={"limit": max_per, "t": "day"},
+                headers=_HEADERS,
+                timeout=REQUEST_TIMEOUT,
+            )
+            resp.raise_for_status()
+
+            children = orjson.loads(resp.content).get("data", {}).get("children", [])
+            for post in children:
+                d = post.get("data", {})
+                if d.get("stickied"):
+                    continue
+
+                url = d.get("url", "")
+                permalink = f"https://www.reddit.com{d.get('permalink', '')}"
+                target = url if url and not url.startswith("/r/") else permalink
+
+                selftext = d.get("selftext", "")
+                desc = (selftext[:300] + "...") if len(selftext) > 300 else selftext
+
+                a = Article(
+                    title=d.get("title", ""),
+                    url=target,
+                    source="reddit",
+                    description=desc,
+                    author=d.get("author", ""),
+                    tags=[f"r/{sub}"],
+                    score=d.get("score", 0),
+                    comments_count=d.get("num_comments", 0),
+                    fetched_at=self.fetched_at,
+                )
+                if a.title and a.url:
+                    posts.append(a)
+
+            time.sleep(REQUEST_DELAY)
+        except Exception as exc:
+            logger.error("Reddit r/%s error: %s", sub, exc)
+
+        return posts